@@ -13,3 +13,13 @@ class ContactConfig(AppConfig):
 
     name = "contact"
     label = "contact"
+
+    def ready(self):
+        """Compiles the email templates at launch"""
+        # Application
+        from core.utils import compile_email_templates
+
+        # Local
+        from .models import Contact
+
+        compile_email_templates(email.template for email in Contact.EmailTemplate)
@@ -20,11 +20,10 @@ from django.utils import timezone
 from jklib.django.db.fields import RequiredField, TrimCharField, TrimTextField
 from jklib.django.db.models import LifeCycleModel
 from jklib.django.db.validators import LengthValidator
-from jklib.django.utils.emails import send_html_email_async
 from jklib.django.utils.settings import get_config
 
 # Application
-from core.utils import render_email_template
+from core.utils import send_email_template
 
 # --------------------------------------------------------------------------------
 # > Helpers
@@ -199,5 +198,6 @@ class Contact(LifeCycleModel):
         :param str to: The recipient email address
         """
         context = {"contact": self}
-        body = render_email_template(email_template.template, context)
-        send_html_email_async(email_template.subject, body, to=to)
+        send_email_template(
+            email_template.template, email_template.subject, to, context
+        )
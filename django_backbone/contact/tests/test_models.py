@@ -2,7 +2,6 @@
 
 # Built-in
 from datetime import timedelta
-from time import sleep
 
 # Django
 from django.conf import settings
@@ -72,11 +71,9 @@ class TestContact(ModelTestCase):
         admin_email = get_config("EMAIL_HOST_USER")
         # No mail
         contact.send_notifications(False, False)
-        sleep(0.4)
         assert len(mail.outbox) == 0
         # Only admin
         contact.send_notifications(True, False)
-        sleep(0.4)
         email = mail.outbox[0]
         assert len(mail.outbox) == 1
         assert email.subject == contact.EmailTemplate.ADMIN_NOTIFICATION.subject
@@ -84,7 +81,6 @@ class TestContact(ModelTestCase):
         assert email.to[0] == admin_email
         # Only user
         contact.send_notifications(False, True)
-        sleep(0.4)
         email = mail.outbox[1]
         assert len(mail.outbox) == 2
         assert email.subject == contact.EmailTemplate.USER_NOTIFICATION.subject
@@ -92,7 +88,6 @@ class TestContact(ModelTestCase):
         assert email.to[0] == contact.email
         # Both
         contact.send_notifications(True, True)
-        sleep(0.4)
         email_1 = mail.outbox[2]
         email_2 = mail.outbox[3]
         subjects = {email_1.subject, email_2.subject}
@@ -2,7 +2,6 @@
 
 # Built-in
 from datetime import date, timedelta
-from time import sleep
 
 # Django
 from django.core import mail
@@ -11,7 +10,7 @@ from django.core import mail
 from jklib.django.utils.settings import get_config
 
 # Application
-from core.tests import BaseActionTestCase
+from core.tests import AdminActionTestCase
 from security.models import NetworkRule
 from users.factories import AdminFactory, UserFactory
 
@@ -25,14 +24,9 @@ from ..models import Contact
 SERVICE_URL = "/api/contacts/"
 
 
-class Base(BaseActionTestCase):
+class Base(AdminActionTestCase):
     """Base class for all the Contact action test cases"""
 
-    def setUp(self):
-        """Creates and authenticates an Admin user"""
-        self.admin = AdminFactory()
-        self.api_client.force_authenticate(self.admin)
-
     @staticmethod
     def assert_instance_representation(instance, response_data):
         """
@@ -98,7 +92,7 @@ class TestCreateContact(Base):
         user = UserFactory()
         admin = AdminFactory()
         # Logged out
-        self.api_client.logout()
+        self.force_logout()
         response = self.http_method(self.url(), data=self.payload)
         assert response.status_code == self.success_code
         # User
@@ -108,7 +102,6 @@ class TestCreateContact(Base):
         )
         assert response.status_code == self.success_code
         # User
-        self.api_client.logout()
         self.api_client.force_authenticate(admin)
         response = self.http_method(
             self.url(), data=self.payload, REMOTE_ADDR="127.0.0.3"
@@ -157,9 +150,8 @@ class TestCreateContact(Base):
     def test_success_notifications(self):
         """Tests that successful Contact creations send notifications"""
         # Without notification
-        self._assert_creation_success_base(self.payload, 1)
+        self._assert_creation_success_base(self.payload)
         assert Contact.objects.count() == 1
-        sleep(0.4)
         assert len(mail.outbox) == 1
         email = mail.outbox[0]
         assert email.subject == Contact.EmailTemplate.ADMIN_NOTIFICATION.subject
@@ -167,9 +159,8 @@ class TestCreateContact(Base):
         # With notification
         mail.outbox = []
         self.payload["notify_user"] = True
-        self._assert_creation_success_base(self.payload, 2)
+        self._assert_creation_success_base(self.payload)
         assert Contact.objects.count() == 2
-        sleep(0.4)
         assert len(mail.outbox) == 2
         email_1, email_2 = mail.outbox[0], mail.outbox[1]
         subjects = [email_1.subject, email_2.subject]
@@ -182,34 +173,33 @@ class TestCreateContact(Base):
     def test_success_user(self):
         """Tests that the User is correctly attached to the created Contact"""
         # Logged user
-        instance = self._assert_creation_success_base(self.payload, 1)
+        instance = self._assert_creation_success_base(self.payload)
         assert Contact.objects.count() == 1
         assert instance.user.id == self.admin.id
         # No user
-        self.api_client.logout()
-        instance = self._assert_creation_success_base(self.payload, 2)
+        self.force_logout()
+        instance = self._assert_creation_success_base(self.payload)
         assert Contact.objects.count() == 2
         assert instance.user is None
 
     def test_success_ip(self):
         """Tests that the IP is correctly computed from the request"""
         ip = "127.0.0.3"
-        instance = self._assert_creation_success_base(self.payload, 1, REMOTE_ADDR=ip)
+        instance = self._assert_creation_success_base(self.payload, REMOTE_ADDR=ip)
         assert Contact.objects.count() == 1
         assert instance.ip == ip
 
-    def _assert_creation_success_base(self, payload, id_, **params):
+    def _assert_creation_success_base(self, payload, **params):
         """
         Performs a creation request and checks its success
         :param payload: The data to pass to our request
-        :param int id_: The expected id of the created instance
         :param params: Extra parameters for the called method
         :return: The created Contact instance
         :rtype: Contact
         """
         response = self.http_method(self.url(), data=payload, **params)
         assert response.status_code == self.success_code
-        instance = Contact.objects.get(id=id_)
+        instance = Contact.objects.latest("id")
         self.assert_payload_matches_instance(payload, instance)
         return instance
 
@@ -305,8 +295,8 @@ class TestBulkDestroyContacts(Base):
     def setUp(self):
         """Also creates 4 Contact instances"""
         super().setUp()
-        [ContactFactory() for _ in range(4)]
-        self.payload = {"ids": [1, 4]}
+        self.contact_ids = [ContactFactory().id for _ in range(4)]
+        self.payload = {"ids": [self.contact_ids[0], self.contact_ids[3]]}
 
     def test_permissions(self):
         """Tests only admins can access this service"""
@@ -321,7 +311,10 @@ class TestBulkDestroyContacts(Base):
         assert response.status_code == self.success_code
         assert Contact.objects.count() == 2
         # Some valid IDs
-        response = self.http_method(self.url(), data={"ids": [2, 6]})
+        unknown_id = self.contact_ids[-1] + 1
+        payload = {"ids": [self.contact_ids[1], unknown_id]}
+        response = self.http_method(self.url(), data=payload)
         assert response.status_code == self.success_code
         assert Contact.objects.count() == 1
-        assert Contact.objects.first().id == Contact.objects.last().id == 3
+        remaining_ids = list(Contact.objects.values_list("id", flat=True))
+        assert remaining_ids == [self.contact_ids[2]]
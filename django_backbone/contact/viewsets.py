@@ -40,7 +40,7 @@ class ContactViewset(
 ):
     """ViewSet for the Contact model"""
 
-    queryset = Contact.objects.all()
+    queryset = Contact.objects.select_related("user")
     viewset_permissions = None
     permission_classes = {
         "default": (IsAdminUser,),
@@ -0,0 +1,20 @@
+"""Test runners for the project"""
+
+# Django
+from django.test.runner import DiscoverRunner, default_test_processes
+
+
+# --------------------------------------------------------------------------------
+# > Runners
+# --------------------------------------------------------------------------------
+class ParallelDiscoverRunner(DiscoverRunner):
+    """
+    DiscoverRunner that spreads the test classes over one process per CPU by default
+    Can still be forced to a single process with `--parallel 1`
+    """
+
+    @classmethod
+    def add_arguments(cls, parser):
+        """Sets the default value of the `--parallel` option to the number of CPUs"""
+        super().add_arguments(parser)
+        parser.set_defaults(parallel=default_test_processes())
@@ -6,11 +6,16 @@ from django.contrib.sessions.models import Session
 from django.db.models.signals import pre_save
 from django.dispatch import receiver
 
+# --------------------------------------------------------------------------------
+# > Constants
+# --------------------------------------------------------------------------------
+FULL_CLEAN_EXEMPTED_MODELS = frozenset((Session, get_user_model()))
+
 
 # --------------------------------------------------------------------------------
 # > Shared
 # --------------------------------------------------------------------------------
-@receiver(pre_save)
+@receiver(pre_save, dispatch_uid="automatic_pre_save_full_clean")
 def automatic_pre_save_full_clean(sender, instance, **kwargs):
     """
     Runs the `full_clean` method before saving the instance, unless this model is exempted
@@ -18,6 +23,5 @@ def automatic_pre_save_full_clean(sender, instance, **kwargs):
     :param Model instance: The model instance
     :param kwargs:
     """
-    whitelist = {Session, get_user_model()}
-    if sender not in whitelist:
+    if sender not in FULL_CLEAN_EXEMPTED_MODELS:
         instance.full_clean()
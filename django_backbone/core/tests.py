@@ -13,6 +13,13 @@ from users.factories import AdminFactory, UserFactory
 class BaseActionTestCase(ActionTestCase):
     """Extends the ActionTestCase to provide utilities like permission-check shortcuts"""
 
+    def force_logout(self):
+        """
+        Removes the forced authentication from the API client
+        Unlike `APIClient.logout`, it does not create and flush a database session
+        """
+        self.api_client.force_authenticate(None)
+
     def assert_admin_permissions(self, url, data=None, user=None, admin=None):
         """
         Checks that the service is only available to admin users
@@ -20,14 +27,14 @@ class BaseActionTestCase(ActionTestCase):
         :param str url: The target url
         :param dict data: The data to pass to the request
         :param User user: An existing non-admin user
-        :param User admin: An existing admin user
+        :param User admin: An existing admin user. Defaults to the TestCase's `admin`.
         """
         if user is None:
             user = UserFactory()
         if admin is None:
-            admin = AdminFactory()
+            admin = getattr(self, "admin", None) or AdminFactory()
         # 401 Not authenticated
-        self.api_client.logout()
+        self.force_logout()
         response = self.http_method(url, data=data)
         assert response.status_code == 401
         # 403 Not admin
@@ -35,7 +42,6 @@ class BaseActionTestCase(ActionTestCase):
         response = self.http_method(url, data=data)
         assert response.status_code == 403
         # 201 Admin
-        self.api_client.logout()
         self.api_client.force_authenticate(admin)
         response = self.http_method(url, data=data)
         assert response.status_code == self.success_code
@@ -49,7 +55,7 @@ class BaseActionTestCase(ActionTestCase):
         user = UserFactory()
         admin = AdminFactory()
         # Logged out
-        self.api_client.logout()
+        self.force_logout()
         response = self.http_method(url, data=data)
         assert response.status_code == self.success_code
         # User
@@ -57,7 +63,6 @@ class BaseActionTestCase(ActionTestCase):
         response = self.http_method(url, data=data)
         assert response.status_code == self.success_code
         # User
-        self.api_client.logout()
         self.api_client.force_authenticate(admin)
         response = self.http_method(url, data=data)
         assert response.status_code == self.success_code
@@ -80,7 +85,7 @@ class BaseActionTestCase(ActionTestCase):
             self.api_client.force_authenticate(user_instance)
             response = self.http_method(url, data=data)
             assert response.status_code == 403
-            self.api_client.logout()
+            self.force_logout()
         response = self.http_method(url, data=data)
         assert response.status_code == self.success_code
 
@@ -93,7 +98,7 @@ class BaseActionTestCase(ActionTestCase):
         :param dict data: The data for the request
         """
         # Logged out
-        self.api_client.logout()
+        self.force_logout()
         response = self.http_method(url, data=data)
         assert response.status_code == 401
         # Not owner
@@ -104,3 +109,17 @@ class BaseActionTestCase(ActionTestCase):
         self.api_client.force_authenticate(owner)
         response = self.http_method(url, data=data)
         assert response.status_code == self.success_code
+
+
+class AdminActionTestCase(BaseActionTestCase):
+    """BaseActionTestCase whose requests are authenticated as an admin user"""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Creates an admin user, shared by all the tests of the class"""
+        cls.admin = AdminFactory()
+
+    def setUp(self):
+        """Authenticates the admin user"""
+        super().setUp()
+        self.api_client.force_authenticate(self.admin)
@@ -1,18 +1,42 @@
 """Utilities for the 'core' app"""
 
+# Built-in
+from functools import lru_cache
+from threading import Thread
 
 # Django
 from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.template import loader
 
 # Personal
-from jklib.django.utils.emails import get_css_content
+from jklib.django.utils.emails import get_css_content, send_html_email
 from jklib.django.utils.network import get_server_domain
-from jklib.django.utils.templates import render_template
 
 
 # --------------------------------------------------------------------------------
-# > Internationalization
+# > Emails
 # --------------------------------------------------------------------------------
+def compile_email_templates(template_paths):
+    """
+    Loads and stores the compiled email templates, usually called in `AppConfig.ready`
+    :param [str] template_paths: Django paths to the template files
+    """
+    for template_path in template_paths:
+        get_email_template(template_path)
+
+
+@lru_cache(maxsize=None)
+def get_email_template(template_path):
+    """
+    Loads and compiles an email template only once, then returns it from memory
+    :param str template_path: Django path to the template file
+    :return: The compiled template
+    :rtype: Template
+    """
+    return loader.get_template(template_path)
+
+
 def render_email_template(template_path, context=None):
     """
     Renders an email template with extended context and custom CSS
@@ -25,7 +49,42 @@ def render_email_template(template_path, context=None):
         context = {}
     additional_context = shared_email_context()
     full_context = {**additional_context, **context}  # Order matters
-    return render_template(template_path, full_context)
+    return get_email_template(template_path).render(full_context)
+
+
+def send_email_template(template_path, subject, to, context=None, async_=True):
+    """
+    Renders an email template and sends it to the recipients
+    When async_, both the rendering and the sending happen outside the request thread
+    Asynchronous sending can be disabled project-wide through `settings.EMAIL_ASYNC`
+    :param str template_path: Django path to the template file
+    :param str subject: Subject of the email
+    :param to: List or comma-separated string of email addresses
+    :type to: list(str) or str
+    :param dict context: Context values for the template
+    :param bool async_: Whether the email will be sent asynchronously. Defaults to True.
+    """
+    args = (template_path, subject, to, context)
+    if async_ and settings.EMAIL_ASYNC:
+        Thread(target=_render_and_send_email, args=args).start()
+    else:
+        _render_and_send_email(*args)
+
+
+def send_email_template_to_many(template_path, subject, contexts, async_=True):
+    """
+    Renders and sends the same email template to several recipients, in one batch
+    The template and the shared context are only computed once for the whole batch
+    :param str template_path: Django path to the template file
+    :param str subject: Subject of the emails
+    :param dict contexts: Context values for the template, mapped to their recipient
+    :param bool async_: Whether the emails will be sent asynchronously. Defaults to True.
+    """
+    args = (template_path, subject, contexts)
+    if async_ and settings.EMAIL_ASYNC:
+        Thread(target=_render_and_send_emails, args=args).start()
+    else:
+        _render_and_send_emails(*args)
 
 
 def shared_email_context():
@@ -38,3 +97,36 @@ def shared_email_context():
         "frontend_url": settings.FRONTEND_ROOT_URL,
         "css": get_css_content(settings.EMAIL_CSS),
     }
+
+
+def _render_and_send_email(template_path, subject, to, context):
+    """
+    Renders an email template and synchronously sends it
+    :param str template_path: Django path to the template file
+    :param str subject: Subject of the email
+    :param to: List or comma-separated string of email addresses
+    :type to: list(str) or str
+    :param dict context: Context values for the template
+    """
+    body = render_email_template(template_path, context)
+    send_html_email(subject, body, to=to)
+
+
+def _render_and_send_emails(template_path, subject, contexts):
+    """
+    Renders an email template for each recipient and synchronously sends the emails
+    All the emails go through a single connection to the email backend
+    :param str template_path: Django path to the template file
+    :param str subject: Subject of the emails
+    :param dict contexts: Context values for the template, mapped to their recipient
+    """
+    template = get_email_template(template_path)
+    additional_context = shared_email_context()
+    messages = []
+    for to, context in contexts.items():
+        body = template.render({**additional_context, **context})  # Order matters
+        message = EmailMessage(subject, body, to=[to])
+        message.content_subtype = "html"
+        messages.append(message)
+    with get_connection() as connection:
+        connection.send_messages(messages)
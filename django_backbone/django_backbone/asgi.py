@@ -0,0 +1,20 @@
+"""
+ASGI config for our project.
+
+It exposes the ASGI callable as a module-level variable named ``application``.
+
+For more information on this file, see
+https://docs.djangoproject.com/en/3.1/howto/deployment/asgi/
+"""
+
+# Built-in
+import os
+
+# Django
+from django.core.asgi import get_asgi_application
+
+# --------------------------------------------------------------------------------
+# > Main
+# --------------------------------------------------------------------------------
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "django_backbone.settings")
+application = get_asgi_application()
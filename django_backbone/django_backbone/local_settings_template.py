@@ -42,6 +42,7 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": os.path.join(BASE_DIR, "database.sqlite3"),
+        "CONN_MAX_AGE": 60,  # Reuse connections across requests (in seconds)
     }
 }
 
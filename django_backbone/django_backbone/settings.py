@@ -110,6 +110,7 @@ STATIC_ROOT = os.path.join(BASE_DIR, "static/")
 MEDIA_URL = "/media/"
 MEDIA_ROOT = os.path.join(BASE_DIR, "media/")
 
+EMAIL_ASYNC = True  # Emails are rendered and sent in a separate thread
 EMAIL_CSS = "core/css/emails.css"
 
 TEMPLATES = [
@@ -248,6 +249,19 @@ FIRST_DAY_OF_WEEK = 1
 SITE_ID = 1
 
 
+# --------------------------------------------------------------------------------
+# > Tests
+# --------------------------------------------------------------------------------
+TESTING = len(sys.argv) > 1 and sys.argv[1] == "test"
+TEST_RUNNER = "core.runners.ParallelDiscoverRunner"
+
+if TESTING:
+    # Hashing strength is irrelevant in tests, and PBKDF2 dominates their runtime
+    PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+    # Emails are in the outbox as soon as the request returns, no need to wait for them
+    EMAIL_ASYNC = False
+
+
 # --------------------------------------------------------------------------------
 # > Local settings
 # --------------------------------------------------------------------------------
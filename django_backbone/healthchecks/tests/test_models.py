@@ -1 +0,0 @@
-"""Tests for the 'healthchecks' models"""
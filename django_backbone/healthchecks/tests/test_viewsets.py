@@ -4,8 +4,7 @@
 from jklib.django.utils.tests import assert_logs
 
 # Application
-from core.tests import BaseActionTestCase
-from users.factories import AdminFactory
+from core.tests import AdminActionTestCase
 
 # Local
 from ..viewsets import Service
@@ -16,7 +15,7 @@ from ..viewsets import Service
 SERVICE_URL = "/api/admin/healthchecks/"
 
 
-class BaseTestCase(BaseActionTestCase):
+class BaseTestCase(AdminActionTestCase):
     """Base class for healthcheck tests that provides utilities"""
 
     # Constant
@@ -28,9 +27,8 @@ class BaseTestCase(BaseActionTestCase):
     service = None
 
     def setUp(self):
-        """Creates and logs an admin, then stores the service endpoint"""
-        self.admin = AdminFactory()
-        self.api_client.force_authenticate(self.admin)
+        """Stores the service endpoint"""
+        super().setUp()
         self.endpoint_url = self.url(context={"service": self.service.name.lower()})
 
     @property
@@ -122,7 +122,7 @@ class HealthcheckViewSet(ImprovedViewSet):
             )
         # Delete
         HealthcheckDummy.objects.all().delete()
-        if HealthcheckDummy.objects.count() > 0:
+        if HealthcheckDummy.objects.exists():
             raise RuntimeError(
                 "Failed to properly delete all HealthcheckDummy instances"
             )
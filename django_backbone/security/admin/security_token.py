@@ -1,12 +1,10 @@
 """TokenAdmin"""
 
 
-# Built-in
-from datetime import datetime, timezone
-
 # Django
 from django.contrib import admin
 from django.db.models import Q
+from django.utils import timezone
 
 # Personal
 from jklib.django.db.admins import CannotAddMixin, CannotEditMixin
@@ -42,7 +40,7 @@ class IsExpiredFilter(admin.SimpleListFilter):
         :return: The updated queryset after we applied our filter
         :rtype: Queryset
         """
-        now = datetime.now(timezone.utc)
+        now = timezone.now()
         if self.value() is None:
             return queryset
         elif self.value():
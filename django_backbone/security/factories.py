@@ -1,8 +1,5 @@
 """Factories for the `users` app"""
 
-# Built-in
-from secrets import token_urlsafe
-
 # Third-party
 import factory
 
@@ -50,7 +47,7 @@ class SecurityTokenFactory(factory.django.DjangoModelFactory):
 
     user = factory.SubFactory(UserFactory)
     type = "factory"
-    value = factory.LazyFunction(lambda: token_urlsafe(50))
+    value = factory.Sequence(lambda x: f"factory-token-{x}")
     # Using model's defaults for:
     #   -> expired_at
     #   -> used_at
@@ -1 +0,0 @@
-"""Factory classes for the 'security' app"""
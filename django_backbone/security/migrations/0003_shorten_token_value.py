@@ -0,0 +1,21 @@
+# Generated by Django 3.1.5 on 2026-10-17 10:15
+
+# Django
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("security", "0002_auto_20210406_2243"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="securitytoken",
+            name="value",
+            field=models.CharField(
+                max_length=100, unique=True, verbose_name="Token value"
+            ),
+        ),
+    ]
@@ -1,17 +1,34 @@
 """Tokens for one-time use"""
 
 # Built-in
-from datetime import datetime, timedelta, timezone
+from datetime import timedelta
 from secrets import token_urlsafe
 
 # Django
 from django.contrib.auth import get_user_model
-from django.db.models import CharField, DateTimeField, Index
+from django.db import transaction
+from django.db.models import CharField, DateTimeField, Index, QuerySet
+from django.utils import timezone
 
 # Personal
 from jklib.django.db.fields import ActiveField, ForeignKeyCascade, RequiredField
 from jklib.django.db.models import LifeCycleModel
-from jklib.django.db.queries import get_object_or_none
+
+
+# --------------------------------------------------------------------------------
+# > QuerySets
+# --------------------------------------------------------------------------------
+class SecurityTokenQuerySet(QuerySet):
+    """Custom queryset for the SecurityToken model"""
+
+    def usable(self):
+        """
+        Filters the tokens that can still be used, mirroring `SecurityToken.can_be_used`
+        :return: The active, unused, and unexpired tokens
+        :rtype: QuerySet
+        """
+        now = timezone.now()
+        return self.filter(is_active_token=True, used_at=None, expired_at__gte=now)
 
 
 # --------------------------------------------------------------------------------
@@ -35,9 +52,12 @@ class SecurityToken(LifeCycleModel):
     # ----------------------------------------
     # Constants
     # ----------------------------------------
+    CLEANUP_BATCH_SIZE = 10000
     MIN_DURATION = 300  # 5 minutes
     MAX_DURATION = 604800  # 7 days
     TYPE_MAX_LENGTH = 50
+    VALUE_BYTES = 32  # 43 characters once encoded
+    VALUE_MAX_LENGTH = 100  # Also fits the 67 characters of former tokens
 
     # ----------------------------------------
     # Fields
@@ -47,11 +67,12 @@ class SecurityToken(LifeCycleModel):
     )
     type = RequiredField(CharField, max_length=TYPE_MAX_LENGTH, verbose_name="Type")
     value = RequiredField(
-        CharField, unique=True, max_length=1000, verbose_name="Token value"
+        CharField, unique=True, max_length=VALUE_MAX_LENGTH, verbose_name="Token value"
     )
     expired_at = RequiredField(DateTimeField, verbose_name="Expires at")
     used_at = DateTimeField(null=True, blank=True, verbose_name="Used at")
     is_active_token = ActiveField()
+    objects = SecurityTokenQuerySet.as_manager()
 
     # ----------------------------------------
     # Behavior (meta, str, save)
@@ -91,7 +112,7 @@ class SecurityToken(LifeCycleModel):
         :return: Whether the token has expired
         :rtype: bool
         """
-        now = datetime.now(timezone.utc)
+        now = timezone.now()
         return self.expired_at < now
 
     @property
@@ -106,15 +127,27 @@ class SecurityToken(LifeCycleModel):
     # Public API
     # ----------------------------------------
     def consume_token(self):
-        """Deactivates the token and stores its used timestamp"""
-        self.used_at = datetime.now(timezone.utc)
-        self.deactivate_token()
+        """
+        Deactivates the token and stores its used timestamp, in a single UPDATE
+        The UPDATE only applies if the row is still active and unused, so that
+        concurrent requests cannot both consume the same token
+        :return: Whether the token was consumed by this call
+        :rtype: bool
+        """
+        now = timezone.now()
+        return self._update_fields(
+            conditions={"is_active_token": True, "used_at": None},
+            used_at=now,
+            is_active_token=False,
+            updated_at=now,
+        )
 
     @classmethod
     def create_new_token(cls, user, token_type, token_duration):
         """
         Creates a new token for the user/type, and deactivates the previous ones
-        :param User user: Instance from the User model
+        :param user: Instance from the User model, or its primary key
+        :type user: User or int
         :param str token_type: Type of the token
         :param int token_duration: Token lifespan in seconds
         :return: The token instance and its value
@@ -124,27 +157,29 @@ class SecurityToken(LifeCycleModel):
         token_params = cls._get_valid_token_params(
             user, token_value, token_type, token_duration
         )
-        cls.deactivate_user_tokens(user, token_params["type"])
-        token_instance = cls.objects.create(**token_params)
+        with transaction.atomic():
+            cls.deactivate_user_tokens(user, token_params["type"])
+            token_instance = cls.objects.create(**token_params)
         return token_instance
 
     def deactivate_token(self):
         """Marks a token as not being the active one anymore"""
-        self.is_active_token = False
-        self.save()
+        now = timezone.now()
+        self._update_fields(is_active_token=False, updated_at=now)
 
     @classmethod
     def deactivate_user_tokens(cls, user, token_type=None):
         """
-        Deactivates all tokens for a user. Can be narrowed down to a specific type.
-        :param User user: The user whose tokens must be deactivated
+        Deactivates all tokens for a user, in a single UPDATE
+        Can be narrowed down to a specific type.
+        :param user: The user (or its primary key) whose tokens must be deactivated
+        :type user: User or int
         :param str token_type: Type of the token. Defaults to None
         """
         tokens = cls.objects.filter(user=user, is_active_token=True)
         if token_type is not None:
             tokens = tokens.filter(type=token_type)
-        for token in tokens:
-            token.deactivate_token()
+        tokens.update(is_active_token=False, updated_at=timezone.now())
 
     @classmethod
     def fetch_token_instance(cls, token_value, token_type):
@@ -155,21 +190,32 @@ class SecurityToken(LifeCycleModel):
         :return: The valid token instance or None
         :rtype: Token or None
         """
-        token = get_object_or_none(cls, value=token_value, type=token_type)
-        if token is not None and token.can_be_used:
-            return token
-        else:
-            return None
+        return (
+            cls.objects.usable()
+            .select_related("user")
+            .filter(value=token_value, type=token_type)
+            .first()
+        )
 
     # ----------------------------------------
     # Cron jobs
     # ----------------------------------------
     @classmethod
     def cleanup_expired_unused_tokens(cls):
-        """Deletes all the tokens that are expired and haven't been used"""
-        now = datetime.now(timezone.utc)
+        """
+        Deletes all the tokens that are expired and haven't been used
+        Tokens have no dependent rows, so we skip the collector and issue raw DELETE
+        queries in batches
+        """
+        now = timezone.now()
         expired_unused_tokens = cls.objects.filter(used_at=None, expired_at__lt=now)
-        expired_unused_tokens.delete()
+        expired_unused_ids = expired_unused_tokens.values_list("id", flat=True)
+        while True:
+            batch_ids = list(expired_unused_ids[: cls.CLEANUP_BATCH_SIZE])
+            if not batch_ids:
+                break
+            batch = cls.objects.filter(id__in=batch_ids)
+            batch._raw_delete(batch.db)
 
     # ----------------------------------------
     # Private
@@ -181,17 +227,36 @@ class SecurityToken(LifeCycleModel):
         :rtype: str
         """
         while True:
-            token_value = token_urlsafe(50)
-            results = cls.objects.filter(value=token_value)
-            if len(results) == 0:
+            token_value = token_urlsafe(cls.VALUE_BYTES)
+            if not cls.objects.filter(value=token_value).exists():
                 break
         return token_value
 
+    def _update_fields(self, conditions=None, **fields):
+        """
+        Updates the instance and its row through a single UPDATE on the given columns
+        The instance is only updated if its row matched the conditions
+        :param dict conditions: Extra filters the row must match. Defaults to None.
+        :param fields: Field names and their new values
+        :return: Whether the row was updated
+        :rtype: bool
+        """
+        if conditions is None:
+            conditions = {}
+        rows = self.__class__.objects.filter(pk=self.pk, **conditions)
+        updated_count = rows.update(**fields)
+        if updated_count == 0:
+            return False
+        for field, value in fields.items():
+            setattr(self, field, value)
+        return True
+
     @classmethod
     def _get_valid_token_params(cls, user, token_value, token_type, token_duration):
         """
         Validates (and replaces if necessary) the parameters for creating a new token
-        :param User user: Instance of the User model
+        :param user: Instance of the User model, or its primary key
+        :type user: User or int
         :param str token_value: Value of the token, which should be unique
         :param str token_type: Type of the token
         :param int token_duration: Token lifespan
@@ -200,9 +265,9 @@ class SecurityToken(LifeCycleModel):
         """
         token_type = cls._validate_token_type(token_type)
         token_duration = cls._validate_token_duration(token_duration)
-        expiration_date = datetime.now(timezone.utc) + timedelta(seconds=token_duration)
+        expiration_date = timezone.now() + timedelta(seconds=token_duration)
         return {
-            "user": user,
+            "user_id": user if isinstance(user, int) else user.pk,
             "type": token_type,
             "value": token_value,
             "expired_at": expiration_date,
@@ -220,7 +285,7 @@ class SecurityToken(LifeCycleModel):
         :return: The initial value, if valid
         :rtype: int
         """
-        if type(value) != int:
+        if not isinstance(value, int) or isinstance(value, bool):
             raise TypeError("Token duration must be an integer")
         if value < cls.MIN_DURATION or value > cls.MAX_DURATION:
             raise ValueError(
@@ -238,7 +303,7 @@ class SecurityToken(LifeCycleModel):
         :return: The trimmed value, if valid
         :rtype: str
         """
-        if type(value) != str:
+        if not isinstance(value, str):
             raise TypeError("Token type must be a string")
         value = value.strip()
         if value == "":
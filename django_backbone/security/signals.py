@@ -19,7 +19,7 @@ LOGGER = logging.getLogger("security")
 # --------------------------------------------------------------------------------
 # > NetworkRule
 # --------------------------------------------------------------------------------
-@receiver(post_save, sender=NetworkRule)
+@receiver(post_save, sender=NetworkRule, dispatch_uid="log_rule_update")
 def log_rule_update(sender, instance, created, **kwargs):
     """
     Any NetworkRule creation or update will be logged into the system
@@ -35,7 +35,7 @@ def log_rule_update(sender, instance, created, **kwargs):
     LOGGER.info(message)
 
 
-@receiver(post_delete, sender=NetworkRule)
+@receiver(post_delete, sender=NetworkRule, dispatch_uid="log_rule_deletion")
 def log_rule_deletion(sender, instance, **kwargs):
     """
     Any NetworkRule deletion will be logged into the system
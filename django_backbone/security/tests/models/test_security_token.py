@@ -4,6 +4,7 @@
 from datetime import timedelta
 
 # Django
+from django.db.models import Count, Q
 from django.utils import timezone
 
 # Personal
@@ -76,28 +77,38 @@ class TestToken(ModelTestCase):
         token = self.model_class.create_new_token(self.user, "test", 600)
         assert token.used_at is None
         assert token.is_active_token
-        token.consume_token()
+        assert token.consume_token()
         assert token.used_at is not None
         assert not token.is_active_token
 
+    def test_consume_token_only_once(self):
+        """Tests a token fetched before being consumed cannot be consumed again"""
+        token = self.model_class.create_new_token(self.user, "test", 600)
+        stale_token = self.model_class.fetch_token_instance(token.value, "test")
+        assert token.consume_token()
+        assert not stale_token.consume_token()
+        assert stale_token.used_at is None
+        token.refresh_from_db(fields=["used_at"])
+        assert token.used_at is not None
+
     def test_create_new_token(self):
         """Tests the API for creating new token and deactivating previous ones"""
-        self.model_class.create_new_token(self.user, "test", 600)
+        token_1 = self.model_class.create_new_token(self.user, "test", 600)
         self.assert_instance_count_equals(1)
         # Create token of same type, which should deactivate the first
         token_2 = self.model_class.create_new_token(self.user, "test", 600)
-        token_1 = self.model_class.objects.get(pk=1)  # Refresh
+        token_1.refresh_from_db()
         assert not token_1.can_be_used
         assert token_2.can_be_used
         # Create token of different type, not deactivating the second
         token_3 = self.model_class.create_new_token(self.user, "other", 600)
-        token_2 = self.model_class.objects.get(pk=2)  # Refresh
+        token_2.refresh_from_db()
         assert token_2.can_be_used
         assert token_3.can_be_used
         # Create token for a different user, does not impact the other users' tokens
         new_user = UserFactory()
         token_4 = self.model_class.create_new_token(new_user, "other", 600)
-        token_3 = self.model_class.objects.get(pk=3)  # Refresh
+        token_3.refresh_from_db()
         assert token_3.can_be_used
         assert token_4.can_be_used
 
@@ -112,37 +123,24 @@ class TestToken(ModelTestCase):
         """Tests we can deactivate all tokens of a user"""
         shared_type = "type 3"
         other_user = UserFactory()
-        self.model_class.create_new_token(self.user, "type 1", 600)
-        self.model_class.create_new_token(self.user, "type 2", 600)
-        self.model_class.create_new_token(self.user, shared_type, 600)
-        self.model_class.create_new_token(other_user, shared_type, 600)
+        tokens_params = [
+            (self.user, "type 1"),
+            (self.user, "type 2"),
+            (self.user, shared_type),
+            (other_user, shared_type),
+        ]
+        tokens = [
+            SecurityTokenFactory.build(**{**self.payload, "user": user, "type": type_})
+            for user, type_ in tokens_params
+        ]
+        self.model_class.objects.bulk_create(tokens)
         self.assert_instance_count_equals(4)
-        # Deactivate only type 1 for user 1
+        # Deactivate only the shared type for user 1
         self.model_class.deactivate_user_tokens(self.user, shared_type)
-        tokens = SecurityToken.objects.all()
-        usable_count, not_usable_count = 0, 0
-        for token in tokens:
-            if token.type == shared_type and token.user == self.user:
-                assert not token.can_be_used
-                not_usable_count += 1
-            else:
-                assert token.can_be_used
-                usable_count += 1
-        assert usable_count == 3
-        assert not_usable_count == 1
+        self._assert_only_tokens_deactivated(Q(user=self.user, type=shared_type), 1, 3)
         # Deactivate all tokens for user 1
         self.model_class.deactivate_user_tokens(self.user)
-        tokens = SecurityToken.objects.all()
-        usable_count, not_usable_count = 0, 0
-        for token in tokens:
-            if token.user == self.user:
-                assert not token.can_be_used
-                not_usable_count += 1
-            else:
-                assert token.can_be_used
-                usable_count += 1
-        assert usable_count == 1
-        assert not_usable_count == 3
+        self._assert_only_tokens_deactivated(Q(user=self.user), 3, 1)
 
     def test_fetch_token_instance(self):
         """Tests we can fetch a valid and usable token instance"""
@@ -161,6 +159,42 @@ class TestToken(ModelTestCase):
         assert not token.can_be_used
         assert self.model_class.fetch_token_instance(token.value, token_type) is None
 
+    def test_fetch_token_instance_after_update(self):
+        """Tests a token fetched once is not returned after being consumed or deactivated"""
+        token_type = "test"
+        fetch = self.model_class.fetch_token_instance
+        # Consumed token
+        token = self.model_class.create_new_token(self.user, token_type, 600)
+        assert fetch(token.value, token_type) is not None
+        token.consume_token()
+        assert fetch(token.value, token_type) is None
+        # Deactivated token
+        token = self.model_class.create_new_token(self.user, token_type, 600)
+        assert fetch(token.value, token_type) is not None
+        token.deactivate_token()
+        assert fetch(token.value, token_type) is None
+        # Token deactivated along with the other tokens of the user
+        token = self.model_class.create_new_token(self.user, token_type, 600)
+        assert fetch(token.value, token_type) is not None
+        self.model_class.deactivate_user_tokens(self.user)
+        assert fetch(token.value, token_type) is None
+
+    # ----------------------------------------
+    # QuerySet Tests
+    # ----------------------------------------
+    def test_usable(self):
+        """Tests the queryset only keeps the tokens that can be used"""
+        token_1 = self.model_class.create_new_token(self.user, "type 1", 600)
+        token_2 = self.model_class.create_new_token(self.user, "type 2", 600)
+        token_3 = self.model_class.create_new_token(self.user, "type 3", 600)
+        token_4 = self.model_class.create_new_token(self.user, "type 4", 600)
+        token_2.deactivate_token()
+        token_3.consume_token()
+        token_4.expired_at = timezone.now() - timedelta(days=1)
+        token_4.save()
+        usable_ids = self.model_class.objects.usable().values_list("id", flat=True)
+        assert list(usable_ids) == [token_1.id]
+
     # ----------------------------------------
     # Cron Jobs Tests
     # ----------------------------------------
@@ -181,4 +215,23 @@ class TestToken(ModelTestCase):
         self.model_class.cleanup_expired_unused_tokens()
         self.assert_instance_count_equals(2)
         with self.assertRaises(self.model_class.DoesNotExist):
-            self.model_class.objects.get(pk=2)
+            self.model_class.objects.get(pk=token_2.pk)
+
+    # ----------------------------------------
+    # Helpers
+    # ----------------------------------------
+    def _assert_only_tokens_deactivated(self, filters, inactive_count, active_count):
+        """
+        Checks, in a single query, that only the tokens matching the filters are inactive
+        :param Q filters: Filters matching the tokens that should be inactive
+        :param int inactive_count: Expected number of tokens matching the filters
+        :param int active_count: Expected number of tokens not matching the filters
+        """
+        counts = self.model_class.objects.aggregate(
+            matching=Count("id", filter=filters),
+            matching_inactive=Count("id", filter=filters & Q(is_active_token=False)),
+            others=Count("id", filter=~filters),
+            others_active=Count("id", filter=~filters & Q(is_active_token=True)),
+        )
+        assert counts["matching"] == counts["matching_inactive"] == inactive_count
+        assert counts["others"] == counts["others_active"] == active_count
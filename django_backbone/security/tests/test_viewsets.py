@@ -7,8 +7,7 @@ from datetime import date, timedelta
 from jklib.django.utils.tests import assert_logs
 
 # Application
-from core.tests import BaseActionTestCase
-from users.factories import AdminFactory
+from core.tests import AdminActionTestCase
 
 # Local
 from ..factories import NetworkRuleFactory
@@ -20,14 +19,9 @@ from ..models import NetworkRule
 SERVICE_URL = "/api/admin/network_rules/"
 
 
-class BaseTestCase(BaseActionTestCase):
+class BaseTestCase(AdminActionTestCase):
     """Base class for all the NetworkRule action test cases"""
 
-    def setUp(self):
-        """Creates and authenticates an Admin user"""
-        self.admin = AdminFactory()
-        self.api_client.force_authenticate(self.admin)
-
     @staticmethod
     def assert_instance_from_payload(instance, payload, mapping=None):
         """
@@ -158,7 +152,7 @@ class TestCreateNetworkRule(BaseTestCase):
         response = self.http_method(self.url(), data=self.payload)
         assert response.status_code == self.success_code
         assert NetworkRule.objects.count() == 1
-        network_rule = NetworkRule.objects.get(pk=1)
+        network_rule = NetworkRule.objects.get()
         self.assert_instance_from_payload(network_rule, self.payload)
         self.assert_instance_representation(network_rule, response.data)
 
@@ -253,7 +247,7 @@ class TestUpdateNetworkRule(BaseTestCase):
         """Tests that we updated a NetworkRule successfully"""
         response = self.http_method(self.detail_url, data=self.payload)
         assert response.status_code == self.success_code
-        network_rule = NetworkRule.objects.get(pk=1)
+        network_rule = NetworkRule.objects.get(pk=self.rule.pk)
         self.assert_instance_from_payload(network_rule, self.payload)
         self.assert_instance_representation(network_rule, response.data)
 
@@ -304,14 +298,13 @@ class TestBulkDestroyNetworkRules(BaseTestCase):
     def setUp(self):
         """Also creates 4 NetworkRules"""
         super().setUp()
-        for i in range(1, 5):
-            NetworkRuleFactory()
+        self.rule_ids = [NetworkRuleFactory().id for _ in range(4)]
 
     @assert_logs("security", "INFO")
     def test_permissions(self):
         """Tests that only admin users can access this service"""
         assert NetworkRule.objects.count() == 4
-        payload = {"ids": [1, 3]}
+        payload = {"ids": [self.rule_ids[0], self.rule_ids[2]]}
         self.assert_admin_permissions(url=self.url(), data=payload)
         assert NetworkRule.objects.count() == 2
 
@@ -319,16 +312,19 @@ class TestBulkDestroyNetworkRules(BaseTestCase):
     def test_success(self):
         """Tests that we can delete several NetworkRules"""
         # Only valid IDs
-        payload = {"ids": [1, 4]}
+        ids = self.rule_ids
+        payload = {"ids": [ids[0], ids[3]]}
         response = self.http_method(self.url(), data=payload)
         assert response.status_code == self.success_code
         assert NetworkRule.objects.count() == 2
         # Some valid IDs
-        payload = {"ids": [2, 6]}
+        unknown_id = ids[-1] + 1
+        payload = {"ids": [ids[1], unknown_id]}
         response = self.http_method(self.url(), data=payload)
         assert response.status_code == self.success_code
         assert NetworkRule.objects.count() == 1
-        assert NetworkRule.objects.first().id == NetworkRule.objects.last().id == 3
+        remaining_ids = list(NetworkRule.objects.values_list("id", flat=True))
+        assert remaining_ids == [ids[2]]
 
 
 class TestClearNetworkRule(BaseTestCase):
@@ -358,12 +354,12 @@ class TestClearNetworkRule(BaseTestCase):
         assert self.rule.is_blacklisted
         response = self.http_method(self.rule_url)
         assert response.status_code == self.success_code
-        updated_rule_1 = NetworkRule.objects.get(pk=self.rule.id)
-        assert not updated_rule_1.is_blacklisted
-        assert updated_rule_1.expires_on is None
-        assert not updated_rule_1.active
-        assert updated_rule_1.status == NetworkRule.Status.NONE
-        self.assert_instance_representation(updated_rule_1, response.data)
+        self.rule.refresh_from_db()
+        assert not self.rule.is_blacklisted
+        assert self.rule.expires_on is None
+        assert not self.rule.active
+        assert self.rule.status == NetworkRule.Status.NONE
+        self.assert_instance_representation(self.rule, response.data)
 
 
 class TestBulkClearNetworkRule(BaseTestCase):
@@ -513,7 +509,7 @@ class TestActivateNewNetworkRule(BaseTestCase):
         response = self.http_method(self.url(), data=self.payload)
         assert response.status_code == self.success_code
         assert NetworkRule.objects.count() == 1
-        rule_1 = NetworkRule.objects.get(pk=1)
+        rule_1 = NetworkRule.objects.get()
         self.assert_instance_from_payload(rule_1, self.payload)
         self.assert_instance_representation(rule_1, response.data)
         # Blacklisted
@@ -524,7 +520,7 @@ class TestActivateNewNetworkRule(BaseTestCase):
         response = self.http_method(self.url(), data=self.payload)
         assert response.status_code == self.success_code
         assert NetworkRule.objects.count() == 2
-        rule_2 = NetworkRule.objects.get(pk=2)
+        rule_2 = NetworkRule.objects.get(ip=self.payload["ip"])
         self.assert_instance_from_payload(rule_2, self.payload)
         self.assert_instance_representation(rule_2, response.data)
 
@@ -576,17 +572,17 @@ class TestActivateExistingNetworkRule(BaseTestCase):
         self.payload["status"] = NetworkRule.Status.BLACKLISTED
         response = self.http_method(self.detail_url, data=self.payload)
         assert response.status_code == 409
-        updated_rule = NetworkRule.objects.get(id=self.rule.id)
-        assert updated_rule.is_whitelisted
+        self.rule.refresh_from_db()
+        assert self.rule.is_whitelisted
         # With override
         self.payload["override"] = True
         response = self.http_method(self.detail_url, data=self.payload)
         assert response.status_code == self.success_code
-        updated_rule = NetworkRule.objects.get(id=self.rule.id)
-        assert updated_rule.is_blacklisted
+        self.rule.refresh_from_db()
+        assert self.rule.is_blacklisted
         del self.payload["override"]
-        self.assert_instance_from_payload(updated_rule, self.payload)
-        self.assert_instance_representation(updated_rule, response.data)
+        self.assert_instance_from_payload(self.rule, self.payload)
+        self.assert_instance_representation(self.rule, response.data)
 
     @assert_logs("security", "INFO")
     def test_success_whitelist_with_override(self):
@@ -597,17 +593,17 @@ class TestActivateExistingNetworkRule(BaseTestCase):
         self.payload["status"] = NetworkRule.Status.WHITELISTED
         response = self.http_method(self.detail_url, data=self.payload)
         assert response.status_code == 409
-        updated_rule = NetworkRule.objects.get(id=self.rule.id)
-        assert updated_rule.is_blacklisted
+        self.rule.refresh_from_db()
+        assert self.rule.is_blacklisted
         # With override
         self.payload["override"] = True
         response = self.http_method(self.detail_url, data=self.payload)
         assert response.status_code == self.success_code
-        updated_rule = NetworkRule.objects.get(id=self.rule.id)
-        assert updated_rule.is_whitelisted
+        self.rule.refresh_from_db()
+        assert self.rule.is_whitelisted
         del self.payload["override"]
-        self.assert_instance_from_payload(updated_rule, self.payload)
-        self.assert_instance_representation(updated_rule, response.data)
+        self.assert_instance_from_payload(self.rule, self.payload)
+        self.assert_instance_representation(self.rule, response.data)
 
     @assert_logs("security", "INFO")
     def test_success(self):
@@ -617,16 +613,16 @@ class TestActivateExistingNetworkRule(BaseTestCase):
         self.payload["status"] = NetworkRule.Status.WHITELISTED
         response = self.http_method(self.detail_url, data=self.payload)
         assert response.status_code == self.success_code
-        updated_rule = NetworkRule.objects.get(id=self.rule.id)
-        assert updated_rule.is_whitelisted
-        self.assert_instance_from_payload(updated_rule, self.payload)
-        self.assert_instance_representation(updated_rule, response.data)
-        updated_rule.clear()
+        self.rule.refresh_from_db()
+        assert self.rule.is_whitelisted
+        self.assert_instance_from_payload(self.rule, self.payload)
+        self.assert_instance_representation(self.rule, response.data)
+        self.rule.clear()
         # Blacklisting
         self.payload["status"] = NetworkRule.Status.BLACKLISTED
         response = self.http_method(self.detail_url, data=self.payload)
         assert response.status_code == self.success_code
-        updated_rule = NetworkRule.objects.get(id=self.rule.id)
-        assert updated_rule.is_blacklisted
-        self.assert_instance_from_payload(updated_rule, self.payload)
-        self.assert_instance_representation(updated_rule, response.data)
+        self.rule.refresh_from_db()
+        assert self.rule.is_blacklisted
+        self.assert_instance_from_payload(self.rule, self.payload)
+        self.assert_instance_representation(self.rule, response.data)
@@ -12,3 +12,13 @@ class UsersConfig(AppConfig):
 
     name = "users"
     label = "users"
+
+    def ready(self):
+        """Compiles the email templates at launch"""
+        # Application
+        from core.utils import compile_email_templates
+
+        # Local
+        from .models import UserEmailTemplate
+
+        compile_email_templates(email.template for email in UserEmailTemplate)
@@ -3,6 +3,9 @@
 # Third-party
 import factory
 
+# Django
+from django.contrib.auth.hashers import identify_hasher, make_password
+
 # Local
 from .models import User
 
@@ -28,11 +31,33 @@ class UserFactory(factory.django.DjangoModelFactory):
     #   -> is_active
     #   -> is_verified
 
-    @factory.post_generation
-    def set_password(self, create, extracted, **kwargs):
-        """Sets the user's password correctly post creation"""
-        self.set_password(self.password)
-        self.save()
+    @classmethod
+    def bulk_create_batch(cls, size, password="Str0ngP4ssw0rd!", **kwargs):
+        """
+        Creates several users with a single INSERT and a single password hash
+        No model signal is sent, and the ids are only set on backends that return them
+        :param int size: Number of users to create
+        :param str password: Raw password shared by all the users
+        :param kwargs: Field values shared by all the users
+        :return: The created users
+        :rtype: list(User)
+        """
+        users = cls.build_batch(size, password=make_password(password), **kwargs)
+        return cls._meta.model.objects.bulk_create(users)
+
+    @classmethod
+    def _adjust_kwargs(cls, **kwargs):
+        """
+        Hashes the raw password before the user is built or created,
+        so that creating a user only takes a single INSERT
+        Passwords that are already hashed are kept as is
+        """
+        password = kwargs["password"]
+        try:
+            identify_hasher(password)
+        except ValueError:
+            kwargs["password"] = make_password(password)
+        return kwargs
 
 
 class AdminFactory(UserFactory):
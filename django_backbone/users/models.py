@@ -11,11 +11,10 @@ from django.db import models
 from django.utils import timezone
 
 # Personal
-from jklib.django.utils.emails import send_html_email, send_html_email_async
 from jklib.django.utils.network import build_url
 
 # Application
-from core.utils import render_email_template
+from core.utils import send_email_template, send_email_template_to_many
 
 # --------------------------------------------------------------------------------
 # > Utilities
@@ -204,11 +203,20 @@ class User(AbstractBaseUser, PermissionsMixin):
         if context is None:
             context = {}
         context["user"] = self
-        body = render_email_template(template_path, context)
-        if async_:
-            send_html_email_async(subject, body, to=self.email)
-        else:
-            send_html_email(subject, body, to=self.email)
+        send_email_template(template_path, subject, self.email, context, async_)
+
+    @classmethod
+    def send_bulk_email(cls, users, email, async_=True):
+        """
+        Sends an email that needs no extra context (like WELCOME) to several users at once
+        The template is rendered for each user, but loaded and set up only once
+        :param users: The users that will receive the email
+        :type users: QuerySet or [User]
+        :param UserEmailTemplate email: The email to send
+        :param bool async_: Whether the emails will be sent asynchronously. Defaults to True.
+        """
+        contexts = {user.email: {"user": user} for user in users}
+        send_email_template_to_many(email.template, email.subject, contexts, async_)
 
     def send_password_updated_email(self, async_=True):
         """
@@ -2,6 +2,7 @@
 
 # Django
 from django.contrib.auth.password_validation import validate_password
+from django.db import transaction
 from rest_framework import serializers
 
 # Personal
@@ -163,14 +164,17 @@ class PasswordResetSerializer(PasswordValidationMixin, ImprovedSerializer):
         """
         Consumes the token, updates the user's password, and returns the updated user
         :param dict validated_data:
+        :raise ValidationError: When the token was consumed by another request
         :return: The found and updated user instance
         :rtype: User
         """
         token_instance = validated_data["token"]
         user = token_instance.user
-        user.set_password(validated_data["password"])
-        user.save()
-        token_instance.consume_token()
+        with transaction.atomic():
+            if not token_instance.consume_token():
+                raise serializers.ValidationError({"token": "Invalid or expired token"})
+            user.set_password(validated_data["password"])
+            user.save(update_fields=["password"])
         return user
 
     @staticmethod
@@ -212,18 +216,21 @@ class UserVerificationSerializer(ImprovedSerializer):
         """
         Consumes to token, flags the corresponding user as verified and returns its instance
         :param dict validated_data:
+        :raise ValidationError: When the token was consumed by another request
         :return: The user instance and whether it was updated
         :rtype: User, bool
         """
         token_instance = validated_data["token"]
         user = token_instance.user
-        has_changed = False
-        if not user.is_verified:
-            user.is_verified = True
-            user.save()
-            has_changed = True
-        token_instance.consume_token()
-        return user, has_changed
+        with transaction.atomic():
+            if not token_instance.consume_token():
+                raise serializers.ValidationError({"token": "Invalid or expired token"})
+            # Conditional UPDATE so that concurrent calls cannot both verify the user
+            updated_count = User.objects.filter(pk=user.pk, is_verified=False).update(
+                is_verified=True
+            )
+        user.is_verified = True
+        return user, updated_count > 0
 
     @staticmethod
     def validate_token(value):
@@ -1,6 +1,9 @@
 """Tests for the 'users' app models"""
 
 
+# Django
+from django.core import mail
+
 # Personal
 from jklib.django.db.tests import ModelTestCase
 
@@ -78,11 +81,21 @@ class TestUser(ModelTestCase):
     # ----------------------------------------
     # Email API tests
     # ----------------------------------------
+    def test_send_bulk_email(self):
+        """Tests that the email is sent once to each of the provided users"""
+        email = UserEmailTemplate.WELCOME
+        users = [self.user, UserFactory()]
+        self.model_class.send_bulk_email(users, email, async_=False)
+        assert len(mail.outbox) == 2
+        for user, sent_email in zip(users, mail.outbox):
+            assert sent_email.subject == email.subject
+            assert sent_email.to == [user.email]
+
     def test_send_password_updated_email(self):
         """Tests that the password updated email is sent correctly"""
         subject = UserEmailTemplate.PASSWORD_UPDATED.subject
         self.user.send_password_updated_email()
-        self.assert_email_was_sent(subject, to=[self.user.email], async_=True)
+        self.assert_email_was_sent(subject, to=[self.user.email], async_=False)
 
     def test_send_reset_password_email(self):
         """Tests that the reset password email is sent correctly and includes a token"""
@@ -133,4 +146,4 @@ class TestUser(ModelTestCase):
         """Tests that the welcome email is sent correctly"""
         subject = UserEmailTemplate.WELCOME.subject
         self.user.send_welcome_email()
-        self.assert_email_was_sent(subject, to=[self.user.email], async_=True)
+        self.assert_email_was_sent(subject, to=[self.user.email], async_=False)
@@ -2,10 +2,11 @@
 
 # Built-in
 from datetime import timedelta
-from time import sleep
 
 # Django
+from django.contrib.auth.hashers import make_password
 from django.utils import timezone
+from rest_framework.exceptions import ValidationError
 
 # Application
 from core.tests import BaseActionTestCase
@@ -14,6 +15,7 @@ from security.models import SecurityToken
 # Local
 from ...factories import AdminFactory, UserFactory
 from ...models import User, UserEmailTemplate
+from ...serializers import PasswordResetSerializer
 
 # --------------------------------------------------------------------------------
 # > Helpers
@@ -119,6 +121,7 @@ class TestCreateUser(Base):
 
     def setUp(self):
         """Resets the email outbox and prepares a valid payload"""
+        super().setUp()
         self.payload = {
             "email": "fakeemail@fakedomain.com",
             "first_name": "FirstName",
@@ -131,7 +134,6 @@ class TestCreateUser(Base):
         """Tests only a non-authenticated user can call this service"""
         self.assert_not_authenticated_permissions(self.url(), self.payload)
         assert User.objects.count() == 3
-        sleep(0.4)  # Due to emails being sent asynchronously
 
     def test_password_field(self):
         """Tests the password strength"""
@@ -146,13 +148,14 @@ class TestCreateUser(Base):
         response = self.http_method(self.url(), data=self.payload)
         assert response.status_code == self.success_code
         assert User.objects.count() == 1
-        user = User.objects.get(id=1)
+        fields = ["email", "first_name", "last_name", "is_verified"]
+        user = User.objects.only(*fields).get()
         self.assert_response_matches_objects(response.data, user, self.payload)
         if not user.is_verified:
             subject = UserEmailTemplate.VERIFY_EMAIL.subject
         else:
             subject = UserEmailTemplate.WELCOME.subject
-        self.assert_email_was_sent(subject, to=[user.email], async_=True)
+        self.assert_email_was_sent(subject, to=[user.email], async_=False)
 
 
 class TestRetrieveUser(Base):
@@ -162,9 +165,14 @@ class TestRetrieveUser(Base):
     http_method_name = "GET"
     success_code = 200
 
+    @classmethod
+    def setUpTestData(cls):
+        """Creates a user, shared by all the tests of the class"""
+        cls.user = UserFactory()
+
     def setUp(self):
-        """Creates and authenticates a user, then prepares a URL"""
-        self.user = UserFactory()
+        """Authenticates the user, then prepares a URL"""
+        super().setUp()
         self.api_client.force_authenticate(self.user)
         self.detail_url = self.url(context={"id": self.user.id})
 
@@ -175,7 +183,8 @@ class TestRetrieveUser(Base):
 
     def test_success(self):
         """Tests the owner can retrieve his information"""
-        response = self.http_method(self.detail_url)
+        with self.assertNumQueries(1):
+            response = self.http_method(self.detail_url)
         self.assert_response_matches_objects(response.data, self.user)
 
 
@@ -186,9 +195,14 @@ class TestUpdateUser(Base):
     http_method_name = "PUT"
     success_code = 200
 
+    @classmethod
+    def setUpTestData(cls):
+        """Creates a user, shared by all the tests of the class"""
+        cls.user = UserFactory()
+
     def setUp(self):
-        """Creates and authenticates a user, then prepares a URL and a payload"""
-        self.user = UserFactory()
+        """Authenticates the user, then prepares a URL and a payload"""
+        super().setUp()
         self.api_client.force_authenticate(self.user)
         self.detail_url = self.url(context={"id": self.user.id})
         self.payload = {
@@ -206,7 +220,9 @@ class TestUpdateUser(Base):
 
     def test_success(self):
         """Tests the owner can successfully update his info"""
-        response = self.http_method(self.detail_url, data=self.payload)
+        # Fetching the user, checking the email is unique, and updating the user
+        with self.assertNumQueries(3):
+            response = self.http_method(self.detail_url, data=self.payload)
         assert response.status_code == self.success_code
         instance = User.objects.get(id=self.user.id)
         self.assert_response_matches_objects(response.data, instance, self.payload)
@@ -219,9 +235,14 @@ class TestDestroyUser(Base):
     http_method_name = "DELETE"
     success_code = 204
 
+    @classmethod
+    def setUpTestData(cls):
+        """Creates a user, shared by all the tests of the class"""
+        cls.user = UserFactory()
+
     def setUp(self):
-        """Creates and authenticates a user, then prepares a URL"""
-        self.user = UserFactory()
+        """Authenticates the user, then prepares a URL"""
+        super().setUp()
         self.api_client.force_authenticate(self.user)
         self.detail_url = self.url(context={"id": self.user.id})
 
@@ -235,7 +256,7 @@ class TestDestroyUser(Base):
         response = self.http_method(self.detail_url)
         assert response.status_code == self.success_code
         assert response.data is None
-        assert User.objects.count() == 0
+        assert not User.objects.exists()
 
 
 class TestPerformPasswordReset(Base):
@@ -245,10 +266,17 @@ class TestPerformPasswordReset(Base):
     http_method_name = "POST"
     success_code = 204
 
+    @classmethod
+    def setUpClass(cls):
+        """Hashes the initial password once for the whole class"""
+        super().setUpClass()
+        cls.initial_password = "Str0ngP4ssw0rd"
+        cls.hashed_password = make_password(cls.initial_password)
+
     def setUp(self):
         """Creates a user, a token, and a valid payload"""
-        self.initial_password = "Str0ngP4ssw0rd"
-        self.user = UserFactory(password=self.initial_password)
+        super().setUp()
+        self.user = UserFactory(password=self.hashed_password)
         self.token_type, self.token_duration = User.RESET_TOKEN
         self.token = SecurityToken.create_new_token(
             self.user, self.token_type, self.token_duration
@@ -262,7 +290,6 @@ class TestPerformPasswordReset(Base):
     def test_permissions(self):
         """Tests only logged out users can use this service"""
         self.assert_not_authenticated_permissions(self.url(), data=self.payload)
-        sleep(0.4)  # Waiting for emails to be sent
 
     def test_password(self):
         """Tests the new password must be strong enough"""
@@ -288,10 +315,21 @@ class TestPerformPasswordReset(Base):
         assert response.status_code == self.success_code
         assert response.data is None
         subject = UserEmailTemplate.PASSWORD_UPDATED.subject
-        self.assert_email_was_sent(subject, to=[self.user.email], async_=True)
-        updated_user = User.objects.get(id=self.user.id)
-        assert updated_user.check_password(self.payload["password"])
-        assert not updated_user.check_password(self.initial_password)
+        self.assert_email_was_sent(subject, to=[self.user.email], async_=False)
+        self.user.refresh_from_db(fields=["password"])
+        assert self.user.check_password(self.payload["password"])
+        assert not self.user.check_password(self.initial_password)
+
+    def test_token_consumed_after_validation(self):
+        """Tests the password is kept if the token gets consumed once validated"""
+        serializer = PasswordResetSerializer(data=self.payload)
+        assert serializer.is_valid()
+        # Another request consumes the same token in the meantime
+        assert self.token.consume_token()
+        with self.assertRaises(ValidationError):
+            serializer.save()
+        self.user.refresh_from_db(fields=["password"])
+        assert self.user.check_password(self.initial_password)
 
 
 class TestPerformVerification(Base):
@@ -303,6 +341,7 @@ class TestPerformVerification(Base):
 
     def setUp(self):
         """Registers the token type and duration"""
+        super().setUp()
         self.token_type, self.token_duration = User.VERIFY_TOKEN
 
     def test_permissions(self):
@@ -310,7 +349,7 @@ class TestPerformVerification(Base):
         user = UserFactory()
         admin = AdminFactory()
         for instance in [None, user, admin]:
-            self.api_client.logout()
+            self.force_logout()
             if instance is not None:
                 self.api_client.force_authenticate(instance)
             else:
@@ -322,7 +361,6 @@ class TestPerformVerification(Base):
             response = self.http_method(self.url(), data=payload)
             assert response.status_code == self.success_code
             assert response.data is None
-        sleep(0.4)
 
     def test_token(self):
         """Tests the user must provide a valid and active VERIFY token"""
@@ -348,7 +386,7 @@ class TestPerformVerification(Base):
         assert response.data is None
         with self.assertRaises((AssertionError, IndexError)):
             subject = UserEmailTemplate.WELCOME.subject
-            self.assert_email_was_sent(subject, to=[user.email], async_=True)
+            self.assert_email_was_sent(subject, to=[user.email], async_=False)
 
     def test_success(self):
         """Tests the user gets verified, the email is sent, and the token is consumed"""
@@ -362,14 +400,27 @@ class TestPerformVerification(Base):
         assert response.data is None
         # Email has been sent
         subject = UserEmailTemplate.WELCOME.subject
-        self.assert_email_was_sent(subject, to=[user.email], async_=True)
+        self.assert_email_was_sent(subject, to=[user.email], async_=False)
         # User has been updated
-        updated_user = User.objects.get(id=user.id)
-        assert updated_user.is_verified
+        user.refresh_from_db(fields=["is_verified"])
+        assert user.is_verified
         # Token has been consumed
-        updated_token = SecurityToken.objects.get(id=token.id)
-        assert updated_token.is_used
-        assert not updated_token.is_active_token
+        token.refresh_from_db(fields=["used_at", "is_active_token"])
+        assert token.is_used
+        assert not token.is_active_token
+
+    def test_token_reuse(self):
+        """Tests a VERIFY token cannot be used twice"""
+        user = UserFactory()
+        token = SecurityToken.create_new_token(
+            user, self.token_type, self.token_duration
+        )
+        payload = {"token": token.value}
+        response = self.http_method(self.url(), data=payload)
+        assert response.status_code == self.success_code
+        response = self.http_method(self.url(), data=payload)
+        assert response.status_code == 400
+        assert len(response.data["token"]) > 0
 
 
 class TestRequestPasswordReset(Base):
@@ -379,25 +430,31 @@ class TestRequestPasswordReset(Base):
     http_method_name = "POST"
     success_code = 202
 
+    @classmethod
+    def setUpTestData(cls):
+        """Creates a user, shared by all the tests of the class"""
+        cls.user = UserFactory()
+
     def setUp(self):
-        """Creates a user and prepares a payload"""
-        self.user = UserFactory()
+        """Prepares a payload"""
+        super().setUp()
         self.payload = {"email": self.user.email}
 
     def test_permissions(self):
         """Tests only a logged out user can use this service"""
         self.assert_not_authenticated_permissions(self.url(), self.payload)
-        sleep(0.4)
 
     def test_unknown_email(self):
         """Tests the service returns OK if unknown user, but sends no email"""
         self.payload["email"] = "unknownemail@domain.com"
-        response = self.http_method(self.url(), self.payload)
+        # Only the user lookup, no token is created
+        with self.assertNumQueries(1):
+            response = self.http_method(self.url(), self.payload)
         assert response.status_code == self.success_code
         assert response.data is None
         with self.assertRaises((AssertionError, IndexError)):
             subject = UserEmailTemplate.REQUEST_PASSWORD_RESET.subject
-            self.assert_email_was_sent(subject, to=[self.user.email], async_=True)
+            self.assert_email_was_sent(subject, to=[self.user.email], async_=False)
 
     def test_success(self):
         """Tests the server correctly sends an email to our user"""
@@ -405,7 +462,7 @@ class TestRequestPasswordReset(Base):
         assert response.status_code == self.success_code
         assert response.data is None
         subject = UserEmailTemplate.REQUEST_PASSWORD_RESET.subject
-        self.assert_email_was_sent(subject, to=[self.user.email], async_=True)
+        self.assert_email_was_sent(subject, to=[self.user.email], async_=False)
 
 
 class TestRequestVerification(Base):
@@ -415,9 +472,14 @@ class TestRequestVerification(Base):
     http_method_name = "POST"
     success_code = 204
 
+    @classmethod
+    def setUpTestData(cls):
+        """Creates a user, shared by all the tests of the class"""
+        cls.user = UserFactory()
+
     def setUp(self):
-        """Creates and authenticates a user, then prepares a URL"""
-        self.user = UserFactory()
+        """Authenticates the user, then prepares a URL"""
+        super().setUp()
         self.api_client.force_authenticate(self.user)
         self.detail_url = self.url(context={"id": self.user.id})
 
@@ -425,14 +487,12 @@ class TestRequestVerification(Base):
         """Tests the user must be the owner and not already verified"""
         admin = AdminFactory()
         self.assert_owner_permissions(self.detail_url, self.user, admin)
-        # If verified, should not work
-        self.user.is_verified = True
-        self.user.save()
-        self.api_client.logout()
-        self.api_client.force_authenticate(self.user)
+        # If verified, should not work (using a copy to keep the shared user intact)
+        User.objects.filter(id=self.user.id).update(is_verified=True)
+        verified_user = User.objects.get(id=self.user.id)
+        self.api_client.force_authenticate(verified_user)
         response = self.http_method(self.detail_url)
         assert response.status_code == 403
-        sleep(0.4)
 
     def test_success(self):
         """Tests an unverified user can receive the verification email"""
@@ -440,7 +500,7 @@ class TestRequestVerification(Base):
         assert response.status_code == self.success_code
         assert response.data is None
         subject = UserEmailTemplate.VERIFY_EMAIL.subject
-        self.assert_email_was_sent(subject, to=[self.user.email], async_=True)
+        self.assert_email_was_sent(subject, to=[self.user.email], async_=False)
 
 
 class TestUpdatePassword(Base):
@@ -452,6 +512,7 @@ class TestUpdatePassword(Base):
 
     def setUp(self):
         """Creates and authenticates a user, then prepares a URL and payload"""
+        super().setUp()
         self.payload = {
             "current_password": "Str0ngP4ssw0rD!",
             "password": "Str0ngP4ssw0rD!!!",
@@ -465,7 +526,6 @@ class TestUpdatePassword(Base):
         """Tests only the owner can reset his own password"""
         admin = AdminFactory(password=self.payload["current_password"])
         self.assert_owner_permissions(self.detail_url, self.user, admin, self.payload)
-        sleep(0.4)  # For the email to be sent
 
     def test_current_password(self):
         """Tests the user must provide the correct current password"""
@@ -487,9 +547,9 @@ class TestUpdatePassword(Base):
         response = self.http_method(self.detail_url, data=self.payload)
         assert response.status_code == self.success_code
         # Check the password has been updated
-        update_user = User.objects.get(id=self.user.id)
-        assert not update_user.check_password(self.payload["current_password"])
-        assert update_user.check_password(self.payload["password"])
+        self.user.refresh_from_db(fields=["password"])
+        assert not self.user.check_password(self.payload["current_password"])
+        assert self.user.check_password(self.payload["password"])
         # Check the email was sent
         subject = UserEmailTemplate.PASSWORD_UPDATED.subject
-        self.assert_email_was_sent(subject, to=[update_user.email], async_=True)
+        self.assert_email_was_sent(subject, to=[self.user.email], async_=False)
@@ -1,10 +1,10 @@
 """Tests for the UserAdmin viewsets"""
 
 # Application
-from core.tests import BaseActionTestCase
+from core.tests import AdminActionTestCase
 
 # Local
-from ...factories import AdminFactory, UserFactory
+from ...factories import UserFactory
 from ...models import User, UserEmailTemplate
 
 # --------------------------------------------------------------------------------
@@ -13,14 +13,9 @@ from ...models import User, UserEmailTemplate
 SERVICE_URL = "/api/admin/users/"
 
 
-class Base(BaseActionTestCase):
+class Base(AdminActionTestCase):
     """Base class for testing the UserAdmin API"""
 
-    def setUp(self):
-        """Creates and authenticates an admin user"""
-        self.admin = AdminFactory()
-        self.api_client.force_authenticate(self.admin)
-
     @staticmethod
     def assert_response_matches_objects(response_data, instance=None, payload=None):
         """
@@ -97,7 +92,7 @@ class TestAdminCreateUser(Base):
         response = self.http_method(self.url(), self.payload)
         assert response.status_code == self.success_code
         assert User.objects.count() == 2
-        created_user = User.objects.get(id=2)
+        created_user = User.objects.get(email=self.payload["email"])
         self.assert_response_matches_objects(response.data, created_user, self.payload)
 
 
@@ -119,11 +114,15 @@ class TestAdminListUsers(Base):
         assert len(response.data) == 1
         user_2 = UserFactory()
         user_3 = UserFactory()
-        response = self.http_method(self.url())
+        # A single query, whatever the number of users
+        with self.assertNumQueries(1):
+            response = self.http_method(self.url())
         assert response.status_code == self.success_code
         assert len(response.data) == 3
-        for i, user in enumerate([self.admin, user_2, user_3]):
-            instance = User.objects.get(id=i + 1)
+        users = [self.admin, user_2, user_3]
+        instances = User.objects.in_bulk([user.id for user in users])
+        for i, user in enumerate(users):
+            instance = instances[user.id]
             self.assert_response_matches_objects(response.data[2 - i], instance)
 
 
@@ -180,8 +179,8 @@ class TestAdminUpdateUser(Base):
         """Tests we can successfully update a user"""
         response = self.http_method(self.detail_url, data=self.payload)
         assert response.status_code == self.success_code
-        update_user = User.objects.get(id=self.user.id)
-        self.assert_response_matches_objects(response.data, update_user, self.payload)
+        self.user.refresh_from_db()
+        self.assert_response_matches_objects(response.data, self.user, self.payload)
 
 
 class TestAdminDestroyUser(Base):
@@ -203,11 +202,10 @@ class TestAdminDestroyUser(Base):
 
     def test_success(self):
         """Tests we can successfully delete a user"""
-        assert User.objects.count() == 2
         response = self.http_method(self.detail_url)
         assert response.status_code == self.success_code
         assert response.data is None
-        assert User.objects.count() == 1
+        assert not User.objects.filter(id=self.user.id).exists()
 
 
 class TestAdminBulkDestroyUsers(Base):
@@ -218,36 +216,38 @@ class TestAdminBulkDestroyUsers(Base):
     success_code = 204
 
     def setUp(self):
-        """Also creates 5 additional users"""
+        """Also creates 5 additional users, in a single query and with a single hash"""
         super().setUp()
-        for i in range(5):
-            UserFactory()
+        UserFactory.bulk_create_batch(5)
+        users = User.objects.exclude(id=self.admin.id).order_by("id")
+        self.user_ids = list(users.values_list("id", flat=True))
 
     def test_permissions(self):
         """Tests it is only accessible to admin users"""
-        payload = {"ids": [2, 3, 5]}
-        assert User.objects.count() == 6
+        ids = self.user_ids
+        payload = {"ids": [ids[0], ids[1], ids[3]]}
         self.assert_admin_permissions(self.url(), data=payload)
-        # The function created 2 users and we deleted 3, so total is -1
-        assert User.objects.count() == 5
+        # The function created 1 user and we deleted 3, so total is -2
+        assert User.objects.count() == 4
 
     def test_success(self):
         """Tests we can successfully delete multiple users at once"""
-        assert User.objects.count() == 6
         # Only valid IDs
-        payload = {"ids": [2, 3, 6]}
+        ids = self.user_ids
+        payload = {"ids": [ids[0], ids[1], ids[4]]}
         response = self.http_method(self.url(), data=payload)
         assert response.status_code == self.success_code
         assert response.data is None
         assert User.objects.count() == 3
         # Some valid IDs
-        payload = {"ids": [5, 10]}
+        unknown_id = ids[-1] + 1
+        payload = {"ids": [ids[3], unknown_id]}
         response = self.http_method(self.url(), data=payload)
         assert response.status_code == self.success_code
         assert response.data is None
         assert User.objects.count() == 2
-        assert User.objects.first().id == 4
-        assert User.objects.last().id == 1
+        remaining_ids = list(User.objects.values_list("id", flat=True))
+        assert remaining_ids == [ids[2], self.admin.id]
 
 
 class TestAdminRequestVerification(Base):
@@ -276,7 +276,7 @@ class TestAdminRequestVerification(Base):
         assert response.data is None
         with self.assertRaises((AssertionError, IndexError)):
             subject = UserEmailTemplate.VERIFY_EMAIL.subject
-            self.assert_email_was_sent(subject, to=[self.user.email], async_=True)
+            self.assert_email_was_sent(subject, to=[self.user.email], async_=False)
 
     def test_success(self):
         """Tests an unverified user can receive the verification email"""
@@ -286,4 +286,4 @@ class TestAdminRequestVerification(Base):
         assert response.status_code == self.success_code
         assert response.data is None
         subject = UserEmailTemplate.VERIFY_EMAIL.subject
-        self.assert_email_was_sent(subject, to=[self.user.email], async_=True)
+        self.assert_email_was_sent(subject, to=[self.user.email], async_=False)
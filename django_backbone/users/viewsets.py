@@ -1,6 +1,7 @@
 """Viewsets for the 'users' app"""
 
 # Django
+from django.db import transaction
 from rest_framework import mixins
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -46,6 +47,8 @@ from .serializers import (
 class UserAdminViewSet(ImprovedModelViewSet):
     """User API for admins"""
 
+    BULK_DESTROY_BATCH_SIZE = 100
+
     queryset = User.objects.all()
     viewset_permissions = (IsAdminUser,)
     permission_classes = {"default": None}
@@ -56,6 +59,27 @@ class UserAdminViewSet(ImprovedModelViewSet):
         "request_verification": None,
     }
 
+    def bulk_destroy(self, request, *args, **kwargs):
+        """
+        Overridden to only load the ids of the users to delete, in batches
+        Their tokens, contacts, and permissions are still handled by the collector
+        """
+        serializer = self.get_valid_serializer(data=request.data)
+        ids = serializer.validated_data["ids"]
+        queryset = self.get_queryset().only("id")
+        batch_size = self.BULK_DESTROY_BATCH_SIZE
+        with transaction.atomic():
+            for i in range(0, len(ids), batch_size):
+                queryset.filter(id__in=ids[i : i + batch_size]).delete()
+        return Response(None, HTTP_204_NO_CONTENT)
+
+    def get_queryset(self):
+        """Overridden to only load the serialized columns when listing users"""
+        queryset = super().get_queryset()
+        if self.action == "list":
+            queryset = queryset.only(*BaseUserAdminSerializer.Meta.fields)
+        return queryset
+
     @action(detail=True, methods=["post"])
     def request_verification(self, request, pk=None):
         """Sends an email to the user for him to verify his account"""